@@ -1,949 +1,1355 @@
-import streamlit as st
-import os
-import pandas as pd
-import unicodedata
-import re
-import zipfile
-import base64
-
-# Configure the page - MUST BE FIRST
-st.set_page_config(
-    page_title="AIMS Directory Generator",
-    page_icon="📁",
-    layout="wide",
-    initial_sidebar_state="expanded"
-)
-
-# Custom CSS
-st.markdown("""
-<style>
-    .main-header {
-        font-size: 2.5rem;
-        color: #1f77b4;
-        text-align: center;
-        margin-bottom: 1rem;
-    }
-    .success-box {
-        background-color: #d4edda;
-        border: 1px solid #c3e6cb;
-        border-radius: 10px;
-        padding: 15px;
-        margin: 10px 0;
-    }
-    .info-box {
-        background-color: #d1ecf1;
-        border: 1px solid #bee5eb;
-        border-radius: 10px;
-        padding: 15px;
-        margin: 10px 0;
-    }
-    .warning-box {
-        background-color: #fff3cd;
-        border: 1px solid #ffeaa7;
-        border-radius: 10px;
-        padding: 15px;
-        margin: 10px 0;
-    }
-</style>
-""", unsafe_allow_html=True)
-
-# Initialize session state
-if 'students_data' not in st.session_state:
-    st.session_state.students_data = []
-if 'courses_data' not in st.session_state:
-    st.session_state.courses_data = []
-if 'workspace_created' not in st.session_state:
-    st.session_state.workspace_created = False
-if 'generation_results' not in st.session_state:
-    st.session_state.generation_results = None
-
-def clean_text(text):
-    """Clean and normalize text by removing ALL special characters including apostrophes"""
-    if pd.isna(text) or text is None or text == "":
-        return ""
-    
-    # Convert to string
-    text = str(text).strip()
-    
-    # Remove accents and special characters
-    text = unicodedata.normalize('NFKD', text)
-    text = text.encode('ASCII', 'ignore').decode('ASCII')
-    
-    # FIXED: Remove ALL special characters including apostrophes, only keep letters, numbers, spaces, and hyphens
-    text = re.sub(r'[^a-zA-Z0-9\s\-]', '', text)
-    
-    # Clean up whitespace
-    text = re.sub(r'\s+', ' ', text).strip()
-    
-    return text
-
-def capitalize_name(name):
-    """Capitalize names properly (handle hyphens)"""
-    if not name:
-        return ""
-    
-    if '-' in name:
-        return '-'.join([part.capitalize() for part in name.split('-')])
-    else:
-        return name.capitalize()
-
-def parse_student_file(uploaded_file):
-    """Parse student data from uploaded file - handles single column CSV"""
-    students = []
-    
-    try:
-        # Try to read as CSV first with multiple encodings
-        encodings = ['utf-8', 'latin-1', 'cp1252', 'iso-8859-1']
-        content = None
-        
-        for encoding in encodings:
-            try:
-                uploaded_file.seek(0)  # Reset file pointer
-                content = uploaded_file.read().decode(encoding)
-                st.success(f"✅ Used {encoding} encoding")
-                break
-            except (UnicodeDecodeError, AttributeError):
-                continue
-        
-        if content is None:
-            # Fallback to latin-1 with replacement
-            uploaded_file.seek(0)
-            content = uploaded_file.read().decode('latin-1', errors='replace')
-            st.warning("⚠️ Used Latin-1 with character replacement")
-        
-        # Parse content line by line
-        lines = content.splitlines()
-        
-        if not lines:
-            st.error("❌ File is empty")
-            return []
-        
-        # Check if first line is header
-        first_line = lines[0].strip().lower()
-        header_keywords = ['lastname', 'firstname', 'surname', 'name', 'nom', 'prenom', 'student']
-        has_header = any(keyword in first_line for keyword in header_keywords)
-        
-        if has_header:
-            st.info(f"📝 Skipping header: {lines[0]}")
-            lines = lines[1:]  # Remove header row
-        
-        # Process each line
-        valid_students = 0
-        for line_num, line in enumerate(lines, 1 if has_header else 0):
-            line = line.strip()
-            if not line:
-                continue
-            
-            # Handle single column with comma-separated names
-            if ',' in line:
-                # Split on the first comma only to handle "Lastname, Firstname"
-                parts = line.split(',', 1)
-                last_name = clean_text(parts[0])
-                first_name = clean_text(parts[1]) if len(parts) > 1 else ""
-                
-                # Capitalize names properly
-                last_name = capitalize_name(last_name)
-                first_name = capitalize_name(first_name)
-                
-                # Validate names
-                if last_name and first_name:
-                    # Additional check to avoid any remaining headers
-                    last_lower = last_name.lower()
-                    first_lower = first_name.lower()
-                    
-                    if (last_lower not in header_keywords and 
-                        first_lower not in header_keywords and
-                        len(last_name) > 1 and len(first_name) > 1):
-                        students.append((last_name, first_name))
-                        valid_students += 1
-                        st.write(f"👤 Line {line_num}: '{line}' → {last_name}, {first_name}")
-            else:
-                st.warning(f"⚠️ Line {line_num} has no comma: '{line}'")
-        
-        if valid_students == 0:
-            st.error("❌ No valid students found. Please check your file format.")
-        
-        return students
-        
-    except Exception as e:
-        st.error(f"❌ Error reading student file: {str(e)}")
-        return []
-
-def parse_course_file(uploaded_file):
-    """Parse course data from uploaded file"""
-    courses = []
-    
-    try:
-        # Try multiple encodings
-        encodings = ['utf-8', 'latin-1', 'cp1252', 'iso-8859-1']
-        content = None
-        
-        for encoding in encodings:
-            try:
-                uploaded_file.seek(0)
-                content = uploaded_file.read().decode(encoding)
-                break
-            except (UnicodeDecodeError, AttributeError):
-                continue
-        
-        if content is None:
-            uploaded_file.seek(0)
-            content = uploaded_file.read().decode('latin-1', errors='replace')
-        
-        lines = content.splitlines()
-        
-        if not lines:
-            st.error("❌ Course file is empty")
-            return []
-        
-        # Check for header
-        first_line = lines[0].strip().lower()
-        header_keywords = ['course', 'coursename', 'courses', 'name', 'subject']
-        has_header = any(keyword in first_line for keyword in header_keywords)
-        
-        if has_header:
-            st.info(f"📝 Skipping course header: {lines[0]}")
-            lines = lines[1:]
-        
-        valid_courses = 0
-        for line_num, line in enumerate(lines, 1 if has_header else 0):
-            original_course = line.strip()
-            course = clean_text(original_course)
-            
-            if course and len(course) > 1:  # Minimum 2 characters
-                # Capitalize course name properly
-                course = ' '.join([word.capitalize() for word in course.split()])
-                courses.append(course)
-                valid_courses += 1
-                st.write(f"📚 Line {line_num}: '{original_course}' → '{course}'")
-        
-        if valid_courses == 0:
-            st.error("❌ No valid courses found. Please check your file format.")
-        
-        return courses
-        
-    except Exception as e:
-        st.error(f"❌ Error reading course file: {str(e)}")
-        return []
-
-def parse_manual_students(student_text):
-    """Parse student data from manual text input"""
-    students = []
-    
-    if not student_text:
-        return students
-        
-    lines = student_text.strip().split('\n')
-    header_keywords = ['lastname', 'firstname', 'surname', 'name', 'nom', 'prenom']
-    
-    for line_num, line in enumerate(lines, 1):
-        line = line.strip()
-        if not line:
-            continue
-            
-        if ',' in line:
-            # Split on the first comma only
-            parts = line.split(',', 1)
-            original_last = parts[0].strip()
-            original_first = parts[1].strip() if len(parts) > 1 else ""
-            
-            last_name = clean_text(original_last)
-            first_name = clean_text(original_first)
-            
-            # Capitalize names properly
-            last_name = capitalize_name(last_name)
-            first_name = capitalize_name(first_name)
-            
-            # Validate names
-            if last_name and first_name:
-                # Skip header-like entries
-                last_lower = last_name.lower()
-                first_lower = first_name.lower()
-                
-                if (last_lower not in header_keywords and 
-                    first_lower not in header_keywords and
-                    len(last_name) > 1 and len(first_name) > 1):
-                    students.append((last_name, first_name))
-                    st.write(f"👤 Line {line_num}: '{line}' → {last_name}, {first_name}")
-        else:
-            st.warning(f"⚠️ Line {line_num} has no comma: '{line}'")
-    
-    return students
-
-def parse_manual_courses(course_text):
-    """Parse course data from manual text input"""
-    courses = []
-    
-    if not course_text:
-        return courses
-        
-    lines = course_text.strip().split('\n')
-    
-    for line_num, line in enumerate(lines, 1):
-        original_course = line.strip()
-        course = clean_text(original_course)
-        
-        if course and len(course) > 1:  # Minimum 2 characters
-            # Capitalize course name properly
-            course = ' '.join([word.capitalize() for word in course.split()])
-            courses.append(course)
-            st.write(f"📚 Line {line_num}: '{original_course}' → '{course}'")
-    
-    return courses
-
-def safe_makedir(path):
-    """Safely create directory if it doesn't exist - returns True if created, False if already exists"""
-    try:
-        if os.path.exists(path):
-            return False
-        os.makedirs(path, exist_ok=True)
-        return True
-    except Exception as e:
-        st.error(f"Error creating directory {path}: {e}")
-        return False
-
-def create_readme_if_missing(path, course_name, first_name, last_name):
-    """Create README.txt file if it doesn't exist - returns True if created, False if already exists"""
-    try:
-        readme_path = os.path.join(path, "README.txt")
-        if os.path.exists(readme_path):
-            return False
-        with open(readme_path, 'w', encoding='utf-8') as f:
-            f.write(f"Course: {course_name}\nStudent: {first_name} {last_name}\n\nThis directory is for coursework and projects.")
-        return True
-    except Exception as e:
-        st.error(f"Error creating README in {path}: {e}")
-        return False
-
-def create_directory_structure(students, courses, base_folder="AIMS-Rwanda-Workspace"):
-    """Create the complete directory structure following all requirements"""
-    results = {
-        'students_processed': len(students),
-        'students_created': 0,
-        'students_skipped': 0,
-        'course_folders_created': 0,
-        'course_folders_skipped': 0,
-        'readmes_created': 0,
-        'readmes_skipped': 0,
-        'base_folder': base_folder
-    }
-    
-    # Create main working directory
-    if not safe_makedir(base_folder):
-        st.info(f"📁 Main directory already exists: {base_folder}")
-    
-    # Create structure for each student
-    for last_name, first_name in students:
-        # Create student folder name in format: "Lastname, Firstname"
-        student_folder = f"{last_name}, {first_name}"
-        student_path = os.path.join(base_folder, student_folder)
-        
-        # Create student directory
-        if safe_makedir(student_path):
-            results['students_created'] += 1
-        else:
-            results['students_skipped'] += 1
-        
-        # Create course folders for this student
-        for course in courses:
-            course_path = os.path.join(student_path, course)
-            
-            # Create course directory
-            if safe_makedir(course_path):
-                results['course_folders_created'] += 1
-            else:
-                results['course_folders_skipped'] += 1
-            
-            # Create README file
-            if create_readme_if_missing(course_path, course, first_name, last_name):
-                results['readmes_created'] += 1
-            else:
-                results['readmes_skipped'] += 1
-    
-    return results
-
-def generate_folder_tree(start_path):
-    """Generate a visual tree structure of folders"""
-    if not os.path.exists(start_path):
-        return "No folders generated yet."
-    
-    tree_lines = [f"{os.path.basename(start_path)}/"]
-    
-    def build_tree(current_path, prefix="", is_last=True):
-        try:
-            items = sorted(os.listdir(current_path))
-            for i, item in enumerate(items):
-                item_path = os.path.join(current_path, item)
-                is_last_item = (i == len(items) - 1)
-                
-                if os.path.isdir(item_path):
-                    tree_lines.append(f"{prefix}{'└── ' if is_last else '├── '}{item}/")
-                    new_prefix = prefix + ("    " if is_last_item else "│   ")
-                    build_tree(item_path, new_prefix, is_last_item)
-                else:
-                    tree_lines.append(f"{prefix}{'└── ' if is_last_item else '├── '}{item}")
-        except Exception as e:
-            tree_lines.append(f"{prefix}⚠️ Error reading: {e}")
-    
-    build_tree(start_path)
-    return "\n".join(tree_lines)
-
-def create_zip_download(folder_path):
-    """Create a ZIP file for download"""
-    try:
-        zip_filename = f"{os.path.basename(folder_path)}.zip"
-        
-        with zipfile.ZipFile(zip_filename, 'w', zipfile.ZIP_DEFLATED) as zipf:
-            for root, dirs, files in os.walk(folder_path):
-                for file in files:
-                    file_path = os.path.join(root, file)
-                    arcname = os.path.relpath(file_path, start=folder_path)
-                    zipf.write(file_path, arcname)
-        
-        return zip_filename
-    except Exception as e:
-        st.error(f"Error creating ZIP file: {e}")
-        return None
-
-def main():
-    # Main header
-    st.markdown('<div class="main-header">📁 AIMS Rwanda Workspace Generator</div>', unsafe_allow_html=True)
-    st.markdown("### **FIXED** - Proper normalization removing ALL special characters")
-    
-    # Sidebar navigation
-    with st.sidebar:
-        st.title("🎯 Navigation")
-        selected_tab = st.radio(
-            "Choose a section:",
-            ["🏠 Home", "📤 Upload Files", "📝 Manual Input", "📊 Results", "📋 Instructions"]
-        )
-        
-        st.markdown("---")
-        st.title("Quick Actions")
-        
-        if st.button("🔄 Reset All Data", use_container_width=True):
-            st.session_state.students_data = []
-            st.session_state.courses_data = []
-            st.session_state.workspace_created = False
-            st.session_state.generation_results = None
-            st.success("Data reset successfully!")
-            st.rerun()
-        
-        if st.button("📋 Load Example Data", use_container_width=True):
-            example_students = [
-                ("Mutie", "Josiah"),
-                ("Kanziga", "Belise"),
-                ("Uwituze", "Djadida"),
-                ("Nizeyimana", "Patrick"),
-                ("Kejang", "Kutlo")
-            ]
-            
-            example_courses = [
-                "Python Programming",
-                "Data Science",
-                "Machine Learning",
-                "Statistical Methods",
-                "Research Project"
-            ]
-            
-            st.session_state.students_data = example_students
-            st.session_state.courses_data = example_courses
-            st.success("📋 Example data loaded successfully!")
-            st.rerun()
-        
-        st.markdown("---")
-        st.markdown("### Normalization Examples")
-        st.info("""
-        **Fixed Examples:**
-        - Ng'ang'a → Nganga
-        - O'nella → Onella  
-        - García → Garcia
-        - François → Francois
-        - M'barek → Mbarek
-        """)
-    
-    # Show selected tab content
-    if selected_tab == "🏠 Home":
-        show_home_page()
-    elif selected_tab == "📤 Upload Files":
-        show_upload_page()
-    elif selected_tab == "📝 Manual Input":
-        show_manual_input_page()
-    elif selected_tab == "📊 Results":
-        show_results_page()
-    else:
-        show_instructions_page()
-
-def show_home_page():
-    """Display the home page"""
-    st.header("🏠 Welcome to AIMS Rwanda Workspace Generator")
-    
-    st.markdown("""
-    <div class="info-box">
-    <h4>🎯 FIXED NORMALIZATION:</h4>
-    <p><strong>Now properly removes ALL special characters including apostrophes:</strong></p>
-    <ul>
-        <li><strong>Ng'ang'a</strong> → <strong>Nganga</strong></li>
-        <li><strong>O'nella</strong> → <strong>Onella</strong></li>
-        <li><strong>García-López</strong> → <strong>Garcia-Lopez</strong></li>
-        <li><strong>François</strong> → <strong>Francois</strong></li>
-        <li><strong>D'cruz</strong> → <strong>Dcruz</strong></li>
-    </ul>
-    </div>
-    """, unsafe_allow_html=True)
-    
-    col1, col2 = st.columns(2)
-    
-    with col1:
-        st.subheader("🎯 What This Tool Does")
-        st.markdown("""
-        This application automatically creates organized folder structures for:
-        - **Students**: Individual folders for each student
-        - **Courses**: Subfolders for each course  
-        - **Organization**: README files in every course folder
-        
-        **Perfect for:**
-        - Course administrators
-        - Research project organization
-        - Student workspace setup
-        - Academic year preparation
-        """)
-    
-    with col2:
-        st.subheader("🚀 Quick Start")
-        st.markdown("""
-        1. **Go to Upload Files** or **Manual Input** tab
-        2. **Provide your data** (upload or type)
-        3. **Preview the data**
-        4. **Generate workspace**
-        5. **Download results**
-        
-        **Input Methods:**
-        - 📤 Upload CSV files
-        - 📝 Manual typing
-        - 📋 Load example data
-        """)
-    
-    # Show current status
-    st.markdown("---")
-    st.subheader("📈 Current Status")
-    
-    col1, col2, col3 = st.columns(3)
-    
-    with col1:
-        if st.session_state.students_data:
-            st.success(f"✅ {len(st.session_state.students_data)} Students Ready")
-        else:
-            st.warning("⚠️ No Students Loaded")
-    
-    with col2:
-        if st.session_state.courses_data:
-            st.success(f"✅ {len(st.session_state.courses_data)} Courses Ready")
-        else:
-            st.warning("⚠️ No Courses Loaded")
-    
-    with col3:
-        if st.session_state.workspace_created:
-            st.success("✅ Workspace Created")
-        else:
-            st.info("ℹ️ Ready to Generate")
-
-def show_upload_page():
-    """Display file upload page"""
-    st.header("📤 Upload CSV Files")
-    
-    st.markdown("""
-    <div class="info-box">
-    <h4>🎯 FIXED NORMALIZATION:</h4>
-    <p><strong>Special characters including apostrophes are now removed:</strong></p>
-    <ul>
-        <li>Ng'ang'a → Nganga</li>
-        <li>O'nella → Onella</li>
-        <li>García → Garcia</li>
-        <li>D'cruz → Dcruz</li>
-    </ul>
-    </div>
-    """, unsafe_allow_html=True)
-    
-    col1, col2 = st.columns(2)
-    
-    with col1:
-        st.subheader("Upload Student List")
-        student_file = st.file_uploader(
-            "Choose student CSV file",
-            type=['csv', 'txt'],
-            key="student_file",
-            help="Upload CSV with 'Lastname, Firstname' format, one student per line"
-        )
-        
-        if student_file is not None:
-            # Validate file
-            if student_file.size == 0:
-                st.error("❌ Student file is empty")
-            else:
-                st.info(f"📄 Uploaded: {student_file.name} ({(student_file.size/1024):.1f} KB)")
-                
-                with st.spinner("Reading student file..."):
-                    students = parse_student_file(student_file)
-                
-                if students:
-                    st.session_state.students_data = students
-                    st.success(f"✅ Successfully loaded {len(students)} students")
-                    
-                    # Show preview
-                    with st.expander("👀 Preview Students", expanded=True):
-                        student_df = pd.DataFrame(students, columns=["Last Name", "First Name"])
-                        st.dataframe(student_df, use_container_width=True)
-                else:
-                    st.error("❌ No valid students found in the file")
-    
-    with col2:
-        st.subheader("Upload Course List")
-        course_file = st.file_uploader(
-            "Choose course CSV file", 
-            type=['csv', 'txt'],
-            key="course_file",
-            help="Upload CSV with course names, one course per line"
-        )
-        
-        if course_file is not None:
-            # Validate file
-            if course_file.size == 0:
-                st.error("❌ Course file is empty")
-            else:
-                st.info(f"📄 Uploaded: {course_file.name} ({(course_file.size/1024):.1f} KB)")
-                
-                with st.spinner("Reading course file..."):
-                    courses = parse_course_file(course_file)
-                
-                if courses:
-                    st.session_state.courses_data = courses
-                    st.success(f"✅ Successfully loaded {len(courses)} courses")
-                    
-                    # Show preview
-                    with st.expander("👀 Preview Courses", expanded=True):
-                        course_df = pd.DataFrame(courses, columns=["Course Name"])
-                        st.dataframe(course_df, use_container_width=True)
-                else:
-                    st.error("❌ No valid courses found in the file")
-    
-    # Show generation section if we have data
-    if st.session_state.students_data and st.session_state.courses_data:
-        show_generation_section()
-
-def show_manual_input_page():
-    """Display manual input page"""
-    st.header("📝 Manual Input")
-    
-    st.markdown("""
-    <div class="info-box">
-    <h4>🎯 FIXED NORMALIZATION:</h4>
-    <p><strong>Special characters including apostrophes are now removed:</strong></p>
-    <ul>
-        <li>Ng'ang'a → Nganga</li>
-        <li>O'nella → Onella</li>
-        <li>García → Garcia</li>
-        <li>D'cruz → Dcruz</li>
-    </ul>
-    </div>
-    """, unsafe_allow_html=True)
-    
-    col1, col2 = st.columns(2)
-    
-    with col1:
-        st.subheader("Enter Students")
-        st.markdown("**Format:** `Lastname, Firstname` (one per line)")
-        
-        student_text = st.text_area(
-            "Student list",
-            height=200,
-            placeholder="Mutie, Josiah\nKanziga, Belise\nNg'ang'a, John\nO'nella, Maria\nGarcía, José\nD'cruz, Anthony",
-            help="Enter students in 'Lastname, Firstname' format, one per line"
-        )
-        
-        if st.button("✅ Process Students", key="process_students", use_container_width=True):
-            if student_text:
-                students = parse_manual_students(student_text)
-                if students:
-                    st.session_state.students_data = students
-                    st.success(f"✅ Processed {len(students)} students")
-                    
-                    # Show preview
-                    with st.expander("👀 Preview Students", expanded=True):
-                        student_df = pd.DataFrame(students, columns=["Last Name", "First Name"])
-                        st.dataframe(student_df, use_container_width=True)
-                else:
-                    st.error("❌ No valid students found. Please check the format.")
-            else:
-                st.error("❌ Please enter some student data")
-    
-    with col2:
-        st.subheader("Enter Courses")
-        st.markdown("**Format:** Course names (one per line)")
-        
-        course_text = st.text_area(
-            "Course list",
-            height=200,
-            placeholder="Python Programming\nData Science\nMachine Learning\nStatistical Methods\nResearch Project",
-            help="Enter course names, one per line"
-        )
-        
-        if st.button("✅ Process Courses", key="process_courses", use_container_width=True):
-            if course_text:
-                courses = parse_manual_courses(course_text)
-                if courses:
-                    st.session_state.courses_data = courses
-                    st.success(f"✅ Processed {len(courses)} courses")
-                    
-                    # Show preview
-                    with st.expander("👀 Preview Courses", expanded=True):
-                        course_df = pd.DataFrame(courses, columns=["Course Name"])
-                        st.dataframe(course_df, use_container_width=True)
-                else:
-                    st.error("❌ No valid courses found")
-            else:
-                st.error("❌ Please enter some course data")
-    
-    # Show generation section if we have data
-    if st.session_state.students_data and st.session_state.courses_data:
-        show_generation_section()
-
-def show_generation_section():
-    """Show workspace generation section"""
-    st.markdown("---")
-    st.header("🚀 Generate Workspace")
-    
-    # Configuration
-    workspace_name = st.text_input(
-        "Workspace Folder Name",
-        value="AIMS-Rwanda-Workspace",
-        help="Name of the main directory to create"
-    )
-    
-    # Show data summary
-    col1, col2 = st.columns(2)
-    with col1:
-        st.info(f"📊 **Students:** {len(st.session_state.students_data)}")
-    with col2:
-        st.info(f"📊 **Courses:** {len(st.session_state.courses_data)}")
-    
-    # Generate button
-    if st.button("🎯 GENERATE DIRECTORY STRUCTURE", type="primary", use_container_width=True):
-        # Validate data
-        if not st.session_state.students_data:
-            st.error("❌ No students data available")
-            return
-        
-        if not st.session_state.courses_data:
-            st.error("❌ No courses data available")
-            return
-        
-        # Generate workspace
-        generate_workspace(workspace_name)
-
-def generate_workspace(workspace_name):
-    """Generate the workspace and show results"""
-    
-    # Progress tracking
-    progress_bar = st.progress(0)
-    status_text = st.empty()
-    
-    status_text.text("📋 Validating data...")
-    progress_bar.progress(20)
-    
-    status_text.text("🏗️ Creating directory structure...")
-    progress_bar.progress(60)
-    
-    try:
-        # Create directory structure
-        results = create_directory_structure(
-            st.session_state.students_data,
-            st.session_state.courses_data,
-            workspace_name
-        )
-        
-        status_text.text("✅ Generation complete!")
-        progress_bar.progress(100)
-        
-        # Store results
-        st.session_state.workspace_created = True
-        st.session_state.generation_results = results
-        
-        st.success("🎉 Workspace generation completed successfully!")
-        
-        # Show results immediately
-        show_results_content(results)
-        
-    except Exception as e:
-        st.error(f"❌ Error during generation: {str(e)}")
-
-def show_results_page():
-    """Display results page"""
-    st.header("📊 Generation Results")
-    
-    if st.session_state.generation_results:
-        show_results_content(st.session_state.generation_results)
-    else:
-        st.info("ℹ️ No generation results available yet. Please generate a workspace first.")
-        
-        if st.session_state.students_data and st.session_state.courses_data:
-            if st.button("Generate Workspace Now", type="primary"):
-                generate_workspace("AIMS-Rwanda-Workspace")
-
-def show_results_content(results):
-    """Display the generation results content"""
-    
-    st.markdown(f"""
-    <div class="success-box">
-    <h3>🎉 Workspace Generation Complete!</h3>
-    <p>Your directory structure has been successfully created in <strong>{results['base_folder']}</strong></p>
-    </div>
-    """, unsafe_allow_html=True)
-    
-    # Metrics
-    st.subheader("📈 Generation Metrics")
-    
-    col1, col2, col3, col4 = st.columns(4)
-    
-    with col1:
-        st.metric("Students Processed", results['students_processed'])
-    
-    with col2:
-        st.metric("Student Folders Created", results['students_created'])
-    
-    with col3:
-        st.metric("Course Folders Created", results['course_folders_created'])
-    
-    with col4:
-        st.metric("README Files Created", results['readmes_created'])
-    
-    # Folder structure preview
-    st.subheader("📁 Folder Structure Preview")
-    
-    if os.path.exists(results['base_folder']):
-        with st.expander("👀 View Folder Tree", expanded=True):
-            folder_tree = generate_folder_tree(results['base_folder'])
-            st.text(folder_tree)
-    else:
-        st.error("❌ Generated folder not found. Please regenerate the workspace.")
-    
-    # Download options
-    st.subheader("📥 Download Options")
-    
-    if os.path.exists(results['base_folder']):
-        col1, col2 = st.columns(2)
-        
-        with col1:
-            if st.button("📦 Create ZIP Download", type="secondary", use_container_width=True):
-                with st.spinner("Creating ZIP archive..."):
-                    zip_filename = create_zip_download(results['base_folder'])
-                    if zip_filename:
-                        # Create download link
-                        with open(zip_filename, "rb") as f:
-                            bytes_data = f.read()
-                            b64 = base64.b64encode(bytes_data).decode()
-                            href = f'<a href="data:application/zip;base64,{b64}" download="{zip_filename}" style="display: inline-block; padding: 10px 20px; background-color: #4CAF50; color: white; text-decoration: none; border-radius: 5px; font-weight: bold;">⬇️ Download ZIP File</a>'
-                            st.markdown(href, unsafe_allow_html=True)
-                            st.success("✅ ZIP file created successfully!")
-        
-        with col2:
-            st.info(f"**Local Path:** `{os.path.abspath(results['base_folder'])}`")
-    else:
-        st.error("❌ Generated folder not found. Please regenerate the workspace.")
-
-def show_instructions_page():
-    """Display instructions page"""
-    st.header("📋 Instructions & Requirements")
-    
-    st.markdown("""
-    <div class="info-box">
-    <h3>🎯 FIXED NORMALIZATION:</h3>
-    <p><strong>Now properly removes ALL special characters including apostrophes:</strong></p>
-    <ul>
-        <li><strong>Ng'ang'a</strong> → <strong>Nganga</strong> (apostrophes removed)</li>
-        <li><strong>O'nella</strong> → <strong>Onella</strong> (apostrophes removed)</li>
-        <li><strong>García-López</strong> → <strong>Garcia-Lopez</strong> (accents removed)</li>
-        <li><strong>François</strong> → <strong>Francois</strong> (accents removed)</li>
-        <li><strong>D'cruz</strong> → <strong>Dcruz</strong> (apostrophes removed)</li>
-    </ul>
-    </div>
-    """, unsafe_allow_html=True)
-    
-    col1, col2 = st.columns(2)
-    
-    with col1:
-        st.subheader("📝 Input Format Requirements")
-        
-        st.markdown("""
-        **Student Data Format:**
-        - One student per line
-        - Format: `Lastname, Firstname`
-        - Example:
-        ```
-        Mutie, Josiah
-        Kanziga, Belise
-        Uwituze, Djadida
-        ```
-        
-        **Course Data Format:**
-        - One course per line
-        - Just the course name
-        - Example:
-        ```
-        Python Programming
-        Data Science  
-        Machine Learning
-        ```
-        """)
-    
-    with col2:
-        st.subheader("🔄 File Upload Options")
-        
-        st.markdown("""
-        **Supported File Types:**
-        - CSV files (.csv)
-        - Text files (.txt)
-        
-        **Encoding Support:**
-        - UTF-8 (recommended)
-        - Latin-1
-        - CP1252
-        - ISO-8859-1
-        
-        **File Structure:**
-        - No complex headers needed
-        - Simple one-column format
-        - Automatic header detection
-        """)
-    
-    st.markdown("---")
-    st.subheader("🎯 Generated Structure")
-    
-    st.markdown("""
-    ```
-    AIMS-Rwanda-Workspace/
-    ├── Mutie, Josiah/
-    │   ├── Python Programming/
-    │   │   └── README.txt
-    │   ├── Data Science/
-    │   │   └── README.txt
-    │   └── Machine Learning/
-    │       └── README.txt
-    ├── Kanziga, Belise/
-    │   ├── Python Programming/
-    │   │   └── README.txt
-    │   ├── Data Science/
-    │   │   └── README.txt
-    │   └── Machine Learning/
-    │       └── README.txt
-    └── ...
-    ```
-    """)
-
-if __name__ == "__main__":
-    try:
-        main()
-    except Exception as e:
-        st.error(f"Application error: {str(e)}")
-        st.info("Please refresh the page and try again.")
+import streamlit as st
+import os
+import pandas as pd
+import unicodedata
+import re
+import zipfile
+import io
+import string
+import functools
+import itertools
+import logging
+import shutil
+import subprocess
+import tempfile
+import pathlib
+from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor
+
+# Marker type for rows that have already been through clean_text /
+# capitalize_name - lets reruns skip re-normalizing session-state data
+Cleaned = namedtuple('Cleaned', ['last', 'first'])
+
+# st.fragment landed in Streamlit 1.33 - fall back to a no-op decorator so
+# the app still runs on older versions
+_fragment = getattr(st, "fragment", None) or (lambda func: func)
+
+logger = logging.getLogger(__name__)
+
+try:
+    from charset_normalizer import from_bytes as _detect_encoding
+except ImportError:  # optional dependency - fall back to a utf-8 probe
+    _detect_encoding = None
+
+# Precompiled patterns for clean_text - compiling once at import avoids
+# re-parsing the pattern on every call
+_KEEP = re.compile(r'[^a-zA-Z0-9\s\-]', re.ASCII)
+_WS = re.compile(r'\s+', re.ASCII)
+
+# Deletion table for the ASCII fast path: str.translate is a C-level table
+# lookup, much cheaper than running the regex engine per character
+_ALLOWED = set(string.ascii_letters + string.digits + string.whitespace + '-')
+_DELETE_TABLE = dict.fromkeys(i for i in range(0x100) if chr(i) not in _ALLOWED)
+
+def _build_fold_table():
+    """Map each common Latin accented code point to the ASCII part of its
+    NFKD decomposition (or delete it), so diacritics can be stripped with a
+    single str.translate instead of an encode/decode round-trip"""
+    table = {}
+    for cp in range(0x80, 0x180):
+        folded = unicodedata.normalize('NFKD', chr(cp)).encode('ascii', 'ignore').decode('ascii')
+        table[cp] = folded or None
+    return table
+
+_FOLD = _build_fold_table()
+
+# Header detection: frozensets give O(1) membership checks per row, and one
+# compiled alternation replaces a substring scan per keyword on the first line
+_NAME_HEADER_SET = frozenset({'lastname', 'firstname', 'surname', 'name', 'nom', 'prenom'})
+_STUDENT_HEADER_SET = _NAME_HEADER_SET | {'student'}
+_STUDENT_HEADER_RE = re.compile('|'.join(map(re.escape, sorted(_STUDENT_HEADER_SET))))
+_COURSE_HEADER_SET = frozenset({'course', 'coursename', 'courses', 'name', 'subject'})
+_COURSE_HEADER_RE = re.compile('|'.join(map(re.escape, sorted(_COURSE_HEADER_SET))))
+
+# Constant tail of every README - encoded once at import
+_README_TAIL = b"\n\nThis directory is for coursework and projects."
+
+# Fixed timestamp for in-memory ZIP entries - keeps archives deterministic
+# and skips per-entry mtime probing
+_ZIP_TS = (1980, 1, 1, 0, 0, 0)
+
+# Configure the page - MUST BE FIRST
+st.set_page_config(
+    page_title="AIMS Directory Generator",
+    page_icon="📁",
+    layout="wide",
+    initial_sidebar_state="expanded"
+)
+
+# Custom CSS
+st.markdown("""
+<style>
+    .main-header {
+        font-size: 2.5rem;
+        color: #1f77b4;
+        text-align: center;
+        margin-bottom: 1rem;
+    }
+    .success-box {
+        background-color: #d4edda;
+        border: 1px solid #c3e6cb;
+        border-radius: 10px;
+        padding: 15px;
+        margin: 10px 0;
+    }
+    .info-box {
+        background-color: #d1ecf1;
+        border: 1px solid #bee5eb;
+        border-radius: 10px;
+        padding: 15px;
+        margin: 10px 0;
+    }
+    .warning-box {
+        background-color: #fff3cd;
+        border: 1px solid #ffeaa7;
+        border-radius: 10px;
+        padding: 15px;
+        margin: 10px 0;
+    }
+</style>
+""", unsafe_allow_html=True)
+
+# Initialize session state
+if 'students_data' not in st.session_state:
+    st.session_state.students_data = []
+if 'courses_data' not in st.session_state:
+    st.session_state.courses_data = []
+if 'workspace_created' not in st.session_state:
+    st.session_state.workspace_created = False
+if 'generation_results' not in st.session_state:
+    st.session_state.generation_results = None
+
+def clean_text(text):
+    """Clean and normalize text by removing ALL special characters including apostrophes"""
+    if pd.isna(text) or text is None or text == "":
+        return ""
+
+    # Delegate to the cached helper - course names and surnames repeat a lot
+    return _clean_str(str(text).strip())
+
+@functools.lru_cache(maxsize=4096)
+def _clean_str(text):
+    """Cached normalization core - takes a plain str, returns the cleaned str"""
+    # Fast path: ASCII input needs no Unicode normalization or encode/decode
+    # round-trip - filter via the translate table and collapse whitespace
+    # with split/join, both single C loops with no regex engine involved
+    if text.isascii():
+        return ' '.join(text.translate(_DELETE_TABLE).split())
+
+    # Quick Check: if the text is already NFKD-normalized there is nothing to
+    # decompose, and whatever non-ASCII characters remain would be dropped by
+    # the ASCII fold anyway - skip the normalize + encode/decode round-trip
+    # and let the filter delete them directly
+    if unicodedata.is_normalized('NFKD', text):
+        return _WS.sub(' ', _KEEP.sub('', text)).strip()
+
+    # Fold common Latin-range diacritics with the precomputed translate
+    # table - no bytes round-trip; anything outside the table falls back to
+    # the full NFKD path below
+    if max(map(ord, text)) < 0x180:
+        return _WS.sub(' ', _KEEP.sub('', text.translate(_FOLD))).strip()
+
+    # Remove accents and special characters
+    text = unicodedata.normalize('NFKD', text)
+    text = text.encode('ASCII', 'ignore').decode('ASCII')
+
+    # FIXED: Remove ALL special characters including apostrophes, only keep letters, numbers, spaces, and hyphens
+    text = _KEEP.sub('', text)
+
+    # Clean up whitespace
+    text = _WS.sub(' ', text).strip()
+
+    return text
+
+@functools.lru_cache(maxsize=4096)
+def capitalize_name(name):
+    """Capitalize names properly (handle hyphens)"""
+    # str.title() capitalizes hyphenated parts natively at C speed; it would
+    # also capitalize after apostrophes, but clean_text strips those upstream
+    return name.title() if name else ""
+
+# The encodings the app supports (see the Instructions page) - detection is
+# constrained to these so the sniffer can't pick an exotic codec that
+# silently mangles accented names
+_SUPPORTED_ENCODINGS = ['utf_8', 'cp1252', 'latin_1', 'iso8859_1']
+
+def _decode_bytes(raw):
+    """Decode uploaded bytes - valid UTF-8 is accepted as-is, anything else
+    is sniffed from the first 8KB among the supported legacy encodings"""
+    # Strict full-body UTF-8 first: valid UTF-8 is unambiguous, and decoding
+    # the whole input means a multibyte character straddling a sample
+    # boundary can never skew detection
+    try:
+        return raw.decode('utf-8'), 'utf-8'
+    except UnicodeDecodeError:
+        pass
+
+    sample = raw[:8192]
+
+    encoding = 'latin-1'
+    if _detect_encoding is not None:
+        best = _detect_encoding(sample, cp_isolation=_SUPPORTED_ENCODINGS).best()
+        if best is not None and best.encoding:
+            encoding = best.encoding
+
+    return raw.decode(encoding, errors='replace'), encoding
+
+def _clean_series(series):
+    """Vectorized clean_text equivalent for a pandas string Series"""
+    series = series.fillna('').astype(str).str.strip()
+    series = series.str.normalize('NFKD').str.encode('ascii', 'ignore').str.decode('ascii')
+    series = series.str.replace(_KEEP, '', regex=True)
+    return series.str.replace(_WS, ' ', regex=True).str.strip()
+
+@st.cache_data(show_spinner=False)
+def _parse_students_bytes(raw):
+    """Parse student rows from raw upload bytes - cached on the bytes so
+    Streamlit reruns don't re-parse an unchanged upload"""
+    content, encoding = _decode_bytes(raw)
+    lines = content.splitlines()
+    meta = {'encoding': encoding, 'empty': not lines, 'header': None, 'skipped': 0}
+
+    if not lines:
+        return [], meta
+
+    # Check if first line is header
+    first_line = lines[0].strip().lower()
+    if _STUDENT_HEADER_RE.search(first_line):
+        meta['header'] = lines[0]
+        lines = lines[1:]  # Remove header row
+
+    # Vectorized parse: one pandas pass over all rows instead of a Python
+    # loop that cleans line by line
+    rows = pd.Series(lines, dtype=str).str.strip()
+    rows = rows[rows != '']
+
+    if rows.empty:
+        return [], meta
+
+    has_comma = rows.str.contains(',', regex=False)
+    meta['skipped'] = int((~has_comma).sum())
+
+    # Split on the first comma only to handle "Lastname, Firstname"
+    rows = rows[has_comma]
+    if rows.empty:
+        return [], meta
+    parts = rows.str.split(',', n=1, expand=True)
+    last = _clean_series(parts[0]).map(capitalize_name)
+    first = _clean_series(parts[1]).map(capitalize_name)
+
+    # Validate names and drop any remaining header-like entries
+    valid = ((last.str.len() > 1) & (first.str.len() > 1) &
+             ~last.str.lower().isin(_STUDENT_HEADER_SET) &
+             ~first.str.lower().isin(_STUDENT_HEADER_SET))
+    return [Cleaned(*row) for row in zip(last[valid], first[valid])], meta
+
+def parse_student_file(uploaded_file):
+    """Parse student data from uploaded file - handles single column CSV"""
+    try:
+        students, meta = _parse_students_bytes(uploaded_file.getvalue())
+
+        st.success(f"✅ Used {meta['encoding']} encoding")
+
+        if meta['empty']:
+            st.error("❌ File is empty")
+            return []
+
+        if meta['header'] is not None:
+            st.info(f"📝 Skipping header: {meta['header']}")
+
+        if meta['skipped']:
+            st.warning(f"⚠️ Skipped {meta['skipped']} line(s) without a comma")
+
+        if not students:
+            st.error("❌ No valid students found. Please check your file format.")
+        else:
+            # One batched preview instead of a st.write per row
+            preview = pd.DataFrame(students, columns=['Last Name', 'First Name'])
+            st.dataframe(preview.head(50), use_container_width=True)
+
+        return students
+
+    except Exception as e:
+        st.error(f"❌ Error reading student file: {str(e)}")
+        return []
+
+@st.cache_data(show_spinner=False)
+def _parse_courses_bytes(raw):
+    """Parse course rows from raw upload bytes - cached on the bytes so
+    Streamlit reruns don't re-parse an unchanged upload"""
+    content, _ = _decode_bytes(raw)
+    lines = content.splitlines()
+    meta = {'empty': not lines, 'header': None}
+
+    if not lines:
+        return [], meta
+
+    # Check for header
+    first_line = lines[0].strip().lower()
+    if _COURSE_HEADER_RE.search(first_line):
+        meta['header'] = lines[0]
+        lines = lines[1:]
+
+    # Vectorized clean, then capitalize each course name properly
+    cleaned = _clean_series(pd.Series(lines, dtype=str))
+    cleaned = cleaned[cleaned.str.len() > 1]  # Minimum 2 characters
+    return list(cleaned.str.title()), meta
+
+def parse_course_file(uploaded_file):
+    """Parse course data from uploaded file"""
+    try:
+        courses, meta = _parse_courses_bytes(uploaded_file.getvalue())
+
+        if meta['empty']:
+            st.error("❌ Course file is empty")
+            return []
+
+        if meta['header'] is not None:
+            st.info(f"📝 Skipping course header: {meta['header']}")
+
+        if not courses:
+            st.error("❌ No valid courses found. Please check your file format.")
+        else:
+            # One batched preview instead of a st.write per row
+            preview = pd.DataFrame({'Course Name': courses})
+            st.dataframe(preview.head(50), use_container_width=True)
+
+        return courses
+
+    except Exception as e:
+        st.error(f"❌ Error reading course file: {str(e)}")
+        return []
+
+def parse_manual_students(student_text):
+    """Parse student data from manual text input"""
+    students = []
+    
+    if not student_text:
+        return students
+        
+    lines = student_text.strip().split('\n')
+
+    # Collect rows and report once after the loop - a st.write per row makes
+    # Streamlit re-render for every line of input
+    parsed_rows = []
+    skipped_lines = []
+
+    for line_num, line in enumerate(lines, 1):
+        line = line.strip()
+        if not line:
+            continue
+
+        if ',' in line:
+            # Split on the first comma only
+            parts = line.split(',', 1)
+            original_last = parts[0].strip()
+            original_first = parts[1].strip() if len(parts) > 1 else ""
+
+            last_name = clean_text(original_last)
+            first_name = clean_text(original_first)
+
+            # Capitalize names properly
+            last_name = capitalize_name(last_name)
+            first_name = capitalize_name(first_name)
+
+            # Validate names
+            if last_name and first_name:
+                # Skip header-like entries
+                last_lower = last_name.lower()
+                first_lower = first_name.lower()
+
+                if (last_lower not in _NAME_HEADER_SET and
+                    first_lower not in _NAME_HEADER_SET and
+                    len(last_name) > 1 and len(first_name) > 1):
+                    students.append(Cleaned(last_name, first_name))
+                    parsed_rows.append((line_num, line, f"{last_name}, {first_name}"))
+        else:
+            skipped_lines.append(line_num)
+
+    if skipped_lines:
+        st.warning(f"⚠️ Skipped {len(skipped_lines)} line(s) without a comma: "
+                   f"{', '.join(map(str, skipped_lines))}")
+    if parsed_rows:
+        st.dataframe(pd.DataFrame(parsed_rows, columns=['#', 'Original', 'Cleaned']),
+                     use_container_width=True)
+
+    return students
+
+def parse_manual_courses(course_text):
+    """Parse course data from manual text input"""
+    courses = []
+    
+    if not course_text:
+        return courses
+        
+    lines = course_text.strip().split('\n')
+
+    # Collect rows and report once after the loop (see parse_manual_students)
+    parsed_rows = []
+
+    for line_num, line in enumerate(lines, 1):
+        original_course = line.strip()
+        course = clean_text(original_course)
+
+        if course and len(course) > 1:  # Minimum 2 characters
+            # Capitalize course name properly
+            course = course.title()
+            courses.append(course)
+            parsed_rows.append((line_num, original_course, course))
+
+    if parsed_rows:
+        st.dataframe(pd.DataFrame(parsed_rows, columns=['#', 'Original', 'Cleaned']),
+                     use_container_width=True)
+
+    return courses
+
+def ensure_cleaned(students):
+    """Idempotence guard for session-state data: rows already tagged as
+    Cleaned pass through untouched, anything else is normalized exactly once"""
+    return [
+        row if isinstance(row, Cleaned)
+        else Cleaned(capitalize_name(clean_text(row[0])), capitalize_name(clean_text(row[1])))
+        for row in students
+    ]
+
+def safe_makedir(path):
+    """Safely create directory if it doesn't exist - returns True if created, False if already exists"""
+    # Single creation attempt - the FileExistsError branch replaces a
+    # separate os.path.exists stat call. makedirs (not mkdir) keeps support
+    # for nested workspace names like "a/b", which are reachable from the
+    # free-text workspace input
+    try:
+        os.makedirs(path)
+        return True
+    except FileExistsError:
+        return False
+    except OSError as e:
+        st.error(f"Error creating directory {path}: {e}")
+        return False
+
+def write_readme_if_missing(readme_path, payload):
+    """Write a README payload if the file doesn't exist - returns a
+    (created, error) pair so callers in worker threads can report failures
+    from the main thread (st.* elements are dropped outside it)"""
+    try:
+        # O_CREAT|O_EXCL creates the file atomically and fails cleanly when it
+        # already exists - no separate stat probe, and no buffered-IO wrapper
+        # overhead for a tiny one-shot write
+        fd = os.open(readme_path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o644)
+    except FileExistsError:
+        return False, None
+    except OSError as e:
+        return False, f"Error creating README at {readme_path}: {e}"
+    try:
+        os.write(fd, payload)
+    finally:
+        os.close(fd)
+    return True, None
+
+def create_directory_structure(students, courses, base_folder="AIMS-Rwanda-Workspace"):
+    """Create the complete directory structure following all requirements"""
+    results = {
+        'students_processed': len(students),
+        'students_created': 0,
+        'students_skipped': 0,
+        'course_folders_created': 0,
+        'course_folders_skipped': 0,
+        'readmes_created': 0,
+        'readmes_skipped': 0,
+        'base_folder': base_folder,
+        'paths': [],
+        'files': [],
+        'errors': []
+    }
+    
+    # Create main working directory
+    if not safe_makedir(base_folder):
+        st.info(f"📁 Main directory already exists: {base_folder}")
+
+    # Snapshot existing entries once per parent directory so existence checks
+    # become in-memory set lookups instead of a stat syscall per path
+    if os.path.isdir(base_folder):
+        existing_students = {entry.name for entry in os.scandir(base_folder)}
+    else:
+        existing_students = set()
+
+    # Precompute per-course path suffixes and README headers once - only the
+    # student name varies inside the loop, so the constant parts are encoded
+    # a single time instead of once per (student, course) pair
+    course_suffixes = [os.sep + course for course in courses]
+    course_headers = [f"Course: {course}\nStudent: ".encode('utf-8') for course in courses]
+    readme_suffix = os.sep + "README.txt"
+    base_prefix = base_folder.rstrip(os.sep) + os.sep
+
+    # Each student's subtree is independent and IO-bound, so overlap the
+    # mkdir/open syscalls across a thread pool (the GIL is released around
+    # filesystem calls) and sum the per-student counts afterwards
+    max_workers = min(32, (os.cpu_count() or 1) * 4)
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = [
+            executor.submit(
+                _create_student_tree, base_prefix, last_name, first_name,
+                courses, course_suffixes, course_headers, readme_suffix,
+                f"{last_name}, {first_name}" in existing_students
+            )
+            for last_name, first_name in students
+        ]
+        for future in futures:
+            counts, files = future.result()
+            for key, value in counts.items():
+                results[key] += value
+            results['files'].extend(files)
+
+    results['paths'] = [path for path, _ in results['files']]
+
+    # Render worker-side failures here on the main thread, where Streamlit
+    # elements actually reach the page
+    for error in results['errors']:
+        st.error(error)
+
+    return results
+
+def _create_student_tree(base_prefix, last_name, first_name, courses,
+                         course_suffixes, course_headers, readme_suffix,
+                         student_exists):
+    """Create one student's folder tree - returns a per-student counts dict
+    and the (path, payload) pairs visited, so later passes can reuse both the
+    file list and the in-memory contents"""
+    counts = {
+        'students_created': 0,
+        'students_skipped': 0,
+        'course_folders_created': 0,
+        'course_folders_skipped': 0,
+        'readmes_created': 0,
+        'readmes_skipped': 0,
+        'errors': []
+    }
+
+    # Student folder name in format: "Lastname, Firstname"
+    student_folder = f"{last_name}, {first_name}"
+    student_path = base_prefix + student_folder
+
+    # Create student directory (parent is known to exist, so a plain mkdir is
+    # enough - no recursive makedirs walk needed)
+    existing_courses = set()
+    if student_exists:
+        counts['students_skipped'] += 1
+        existing_courses = {entry.name for entry in os.scandir(student_path)}
+    else:
+        try:
+            os.mkdir(student_path)
+            counts['students_created'] += 1
+        except FileExistsError:
+            # Duplicate student entry or concurrent creation - treat as skipped
+            counts['students_skipped'] += 1
+
+    # The student name is the only per-student part of the README - encode it
+    # once and join it with the preencoded course header and tail
+    name_bytes = f"{first_name} {last_name}".encode('utf-8')
+    files = []
+
+    # Create course folder and README together - each course directory is
+    # visited exactly once
+    for course, suffix, header in zip(courses, course_suffixes, course_headers):
+        course_path = student_path + suffix
+
+        if course in existing_courses:
+            counts['course_folders_skipped'] += 1
+        else:
+            try:
+                os.mkdir(course_path)
+                counts['course_folders_created'] += 1
+            except FileExistsError:
+                counts['course_folders_skipped'] += 1
+
+        readme_path = course_path + readme_suffix
+        payload = header + name_bytes + _README_TAIL
+        created, error = write_readme_if_missing(readme_path, payload)
+        if created:
+            counts['readmes_created'] += 1
+        elif error is None:
+            counts['readmes_skipped'] += 1
+        else:
+            # Real I/O failure - report it instead of counting it as skipped
+            counts['errors'].append(error)
+        files.append((readme_path, payload))
+
+    return counts, files
+
+# Cap on rendered tree lines so the UI cost stays bounded for big workspaces
+_TREE_MAX_LINES = 500
+
+@st.cache_data(ttl=5, show_spinner=False)
+def generate_folder_tree(start_path):
+    """Generate a visual tree structure of folders, truncated for display"""
+    if not os.path.exists(start_path):
+        return "No folders generated yet."
+
+    def _scan_sorted(path):
+        # scandir's DirEntry carries the file type from the directory read
+        # itself, so is_dir() needs no extra stat per entry
+        return sorted(os.scandir(path), key=lambda e: e.name)
+
+    def iter_tree(root):
+        # Iterative walk with an explicit stack of (entries, prefix, index)
+        # frames - no recursion depth limit, one scandir per directory
+        try:
+            frames = [(_scan_sorted(root), "", 0)]
+        except Exception as e:
+            yield f"⚠️ Error reading: {e}"
+            return
+
+        while frames:
+            entries, prefix, i = frames[-1]
+            if i >= len(entries):
+                frames.pop()
+                continue
+            frames[-1] = (entries, prefix, i + 1)
+
+            entry = entries[i]
+            is_last_item = (i == len(entries) - 1)
+            connector = '└── ' if is_last_item else '├── '
+
+            if entry.is_dir(follow_symlinks=False):
+                yield f"{prefix}{connector}{entry.name}/"
+                new_prefix = prefix + ("    " if is_last_item else "│   ")
+                try:
+                    frames.append((_scan_sorted(entry.path), new_prefix, 0))
+                except Exception as e:
+                    yield f"{new_prefix}⚠️ Error reading: {e}"
+            else:
+                yield f"{prefix}{connector}{entry.name}"
+
+    # Lines are yielded lazily and only the first _TREE_MAX_LINES are built
+    # into the display string; the rest is summarized as a count
+    lines = itertools.chain([f"{os.path.basename(start_path)}/"], iter_tree(start_path))
+    shown = list(itertools.islice(lines, _TREE_MAX_LINES))
+    remaining = sum(1 for _ in lines)
+    if remaining:
+        shown.append(f"... ({remaining} more entries)")
+    return "\n".join(shown)
+
+def _workspace_signature(base_folder):
+    """Cheap change signature for the workspace tree - the max directory
+    mtime plus the file count, enough to invalidate the cached ZIP whenever
+    the workspace is regenerated"""
+    max_mtime = 0.0
+    total_files = 0
+    for root, dirs, files in os.walk(base_folder):
+        total_files += len(files)
+        mtime = os.stat(root).st_mtime
+        if mtime > max_mtime:
+            max_mtime = mtime
+    return (max_mtime, total_files)
+
+@st.cache_data(show_spinner=False)
+def _cached_zip(base_folder, sig, compress=False, files=None):
+    """Cached ZIP build - sig carries the tree signature so repeat clicks on
+    an unchanged workspace return the archive bytes instantly"""
+    return create_zip_download(base_folder, compress, files)
+
+def create_zip_download(folder_path, compress=False, files=None):
+    """Build a ZIP of the workspace and return its bytes"""
+    try:
+        # The system zip binary archives the whole tree in one C process
+        # instead of a Python-level call per file; fall back to zipfile when
+        # the binary isn't available
+        zip_bytes = _system_zip(folder_path, compress)
+        if zip_bytes is not None:
+            return zip_bytes
+        return _python_zip(folder_path, compress, files)
+    except Exception as e:
+        st.error(f"Error creating ZIP file: {e}")
+        return None
+
+def _system_zip(folder_path, compress):
+    """Archive the workspace with the system zip binary - returns the ZIP
+    bytes, or None when the binary is missing or fails"""
+    tmp_dir = tempfile.mkdtemp()
+    tmp_path = os.path.join(tmp_dir, 'workspace.zip')
+    try:
+        # cwd=folder_path with '.' keeps arcnames relative to the workspace
+        # root, matching the zipfile fallback's layout
+        subprocess.run(
+            ['zip', '-rq', '-1' if compress else '-0', tmp_path, '.'],
+            cwd=folder_path, check=True,
+            stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL
+        )
+        with open(tmp_path, 'rb') as f:
+            return f.read()
+    except (FileNotFoundError, subprocess.CalledProcessError):
+        return None
+    finally:
+        shutil.rmtree(tmp_dir, ignore_errors=True)
+
+def _python_zip(folder_path, compress, files=None):
+    """In-memory zipfile fallback for create_zip_download"""
+    # BytesIO avoids the write-to-disk-then-reread round-trip. ZIP_STORED
+    # is the default - the tiny README payloads can't repay deflate work -
+    # with light level-1 deflate as an opt-in for users who want it
+    buf = io.BytesIO()
+    if compress:
+        comp_args = {'compression': zipfile.ZIP_DEFLATED, 'compresslevel': 1}
+    else:
+        comp_args = {'compression': zipfile.ZIP_STORED}
+
+    with zipfile.ZipFile(buf, 'w', **comp_args) as zipf:
+        # Emit each directory entry exactly once - keeps empty folders in
+        # the archive without duplicating central-directory records
+        seen_dirs = set()
+
+        if files:
+            # Reuse the (path, payload) pairs collected during generation:
+            # the content is already in memory, so writestr with a fixed
+            # timestamp replaces the open/read/close syscalls per tiny README
+            for file_path, payload in files:
+                arcname = os.path.relpath(file_path, start=folder_path).replace(os.sep, '/')
+                parent = os.path.dirname(arcname)
+                missing = []
+                while parent and parent not in seen_dirs:
+                    missing.append(parent)
+                    seen_dirs.add(parent)
+                    parent = os.path.dirname(parent)
+                for rel_dir in reversed(missing):
+                    zipf.writestr(rel_dir + '/', '')
+                info = zipfile.ZipInfo(arcname, date_time=_ZIP_TS)
+                info.compress_type = comp_args['compression']
+                info.external_attr = 0o644 << 16
+                # A prebuilt ZipInfo bypasses the archive-level compresslevel,
+                # so restate it here or deflate falls back to zlib's default
+                zipf.writestr(info, payload,
+                              compresslevel=comp_args.get('compresslevel'))
+        else:
+            for root, dirs, files in os.walk(folder_path):
+                rel_root = os.path.relpath(root, start=folder_path)
+                if rel_root != '.' and rel_root not in seen_dirs:
+                    seen_dirs.add(rel_root)
+                    zipf.writestr(rel_root.replace(os.sep, '/') + '/', '')
+                for file in files:
+                    file_path = os.path.join(root, file)
+                    arcname = os.path.relpath(file_path, start=folder_path)
+                    zipf.write(file_path, arcname)
+
+    return buf.getvalue()
+
+def main():
+    # Main header
+    st.markdown('<div class="main-header">📁 AIMS Rwanda Workspace Generator</div>', unsafe_allow_html=True)
+    st.markdown("### **FIXED** - Proper normalization removing ALL special characters")
+    
+    # Sidebar navigation
+    with st.sidebar:
+        st.title("🎯 Navigation")
+        selected_tab = st.radio(
+            "Choose a section:",
+            ["🏠 Home", "📤 Upload Files", "📝 Manual Input", "📊 Results", "📋 Instructions"]
+        )
+        
+        st.markdown("---")
+        st.title("Quick Actions")
+        
+        if st.button("🔄 Reset All Data", use_container_width=True):
+            st.session_state.students_data = []
+            st.session_state.courses_data = []
+            st.session_state.workspace_created = False
+            st.session_state.generation_results = None
+            st.success("Data reset successfully!")
+            st.rerun()
+        
+        if st.button("📋 Load Example Data", use_container_width=True):
+            example_students = [
+                Cleaned("Mutie", "Josiah"),
+                Cleaned("Kanziga", "Belise"),
+                Cleaned("Uwituze", "Djadida"),
+                Cleaned("Nizeyimana", "Patrick"),
+                Cleaned("Kejang", "Kutlo")
+            ]
+            
+            example_courses = [
+                "Python Programming",
+                "Data Science",
+                "Machine Learning",
+                "Statistical Methods",
+                "Research Project"
+            ]
+            
+            st.session_state.students_data = example_students
+            st.session_state.courses_data = example_courses
+            st.success("📋 Example data loaded successfully!")
+            st.rerun()
+        
+        st.markdown("---")
+        st.markdown("### Normalization Examples")
+        st.info("""
+        **Fixed Examples:**
+        - Ng'ang'a → Nganga
+        - O'nella → Onella  
+        - García → Garcia
+        - François → Francois
+        - M'barek → Mbarek
+        """)
+    
+    # Show selected tab content
+    if selected_tab == "🏠 Home":
+        show_home_page()
+    elif selected_tab == "📤 Upload Files":
+        show_upload_page()
+    elif selected_tab == "📝 Manual Input":
+        show_manual_input_page()
+    elif selected_tab == "📊 Results":
+        show_results_page()
+    else:
+        show_instructions_page()
+
+def show_home_page():
+    """Display the home page"""
+    st.header("🏠 Welcome to AIMS Rwanda Workspace Generator")
+    
+    st.markdown("""
+    <div class="info-box">
+    <h4>🎯 FIXED NORMALIZATION:</h4>
+    <p><strong>Now properly removes ALL special characters including apostrophes:</strong></p>
+    <ul>
+        <li><strong>Ng'ang'a</strong> → <strong>Nganga</strong></li>
+        <li><strong>O'nella</strong> → <strong>Onella</strong></li>
+        <li><strong>García-López</strong> → <strong>Garcia-Lopez</strong></li>
+        <li><strong>François</strong> → <strong>Francois</strong></li>
+        <li><strong>D'cruz</strong> → <strong>Dcruz</strong></li>
+    </ul>
+    </div>
+    """, unsafe_allow_html=True)
+    
+    col1, col2 = st.columns(2)
+    
+    with col1:
+        st.subheader("🎯 What This Tool Does")
+        st.markdown("""
+        This application automatically creates organized folder structures for:
+        - **Students**: Individual folders for each student
+        - **Courses**: Subfolders for each course  
+        - **Organization**: README files in every course folder
+        
+        **Perfect for:**
+        - Course administrators
+        - Research project organization
+        - Student workspace setup
+        - Academic year preparation
+        """)
+    
+    with col2:
+        st.subheader("🚀 Quick Start")
+        st.markdown("""
+        1. **Go to Upload Files** or **Manual Input** tab
+        2. **Provide your data** (upload or type)
+        3. **Preview the data**
+        4. **Generate workspace**
+        5. **Download results**
+        
+        **Input Methods:**
+        - 📤 Upload CSV files
+        - 📝 Manual typing
+        - 📋 Load example data
+        """)
+    
+    # Show current status
+    st.markdown("---")
+    st.subheader("📈 Current Status")
+    
+    col1, col2, col3 = st.columns(3)
+    
+    with col1:
+        if st.session_state.students_data:
+            st.success(f"✅ {len(st.session_state.students_data)} Students Ready")
+        else:
+            st.warning("⚠️ No Students Loaded")
+    
+    with col2:
+        if st.session_state.courses_data:
+            st.success(f"✅ {len(st.session_state.courses_data)} Courses Ready")
+        else:
+            st.warning("⚠️ No Courses Loaded")
+    
+    with col3:
+        if st.session_state.workspace_created:
+            st.success("✅ Workspace Created")
+        else:
+            st.info("ℹ️ Ready to Generate")
+
+def show_upload_page():
+    """Display file upload page"""
+    st.header("📤 Upload CSV Files")
+    
+    st.markdown("""
+    <div class="info-box">
+    <h4>🎯 FIXED NORMALIZATION:</h4>
+    <p><strong>Special characters including apostrophes are now removed:</strong></p>
+    <ul>
+        <li>Ng'ang'a → Nganga</li>
+        <li>O'nella → Onella</li>
+        <li>García → Garcia</li>
+        <li>D'cruz → Dcruz</li>
+    </ul>
+    </div>
+    """, unsafe_allow_html=True)
+    
+    col1, col2 = st.columns(2)
+    
+    with col1:
+        st.subheader("Upload Student List")
+        student_file = st.file_uploader(
+            "Choose student CSV file",
+            type=['csv', 'txt'],
+            key="student_file",
+            help="Upload CSV with 'Lastname, Firstname' format, one student per line"
+        )
+        
+        if student_file is not None:
+            # Validate file
+            if student_file.size == 0:
+                st.error("❌ Student file is empty")
+            else:
+                st.info(f"📄 Uploaded: {student_file.name} ({(student_file.size/1024):.1f} KB)")
+                
+                with st.spinner("Reading student file..."):
+                    students = parse_student_file(student_file)
+                
+                if students:
+                    st.session_state.students_data = students
+                    st.success(f"✅ Successfully loaded {len(students)} students")
+                    
+                    # Show preview
+                    with st.expander("👀 Preview Students", expanded=True):
+                        student_df = pd.DataFrame(students, columns=["Last Name", "First Name"])
+                        st.dataframe(student_df, use_container_width=True)
+                else:
+                    st.error("❌ No valid students found in the file")
+    
+    with col2:
+        st.subheader("Upload Course List")
+        course_file = st.file_uploader(
+            "Choose course CSV file", 
+            type=['csv', 'txt'],
+            key="course_file",
+            help="Upload CSV with course names, one course per line"
+        )
+        
+        if course_file is not None:
+            # Validate file
+            if course_file.size == 0:
+                st.error("❌ Course file is empty")
+            else:
+                st.info(f"📄 Uploaded: {course_file.name} ({(course_file.size/1024):.1f} KB)")
+                
+                with st.spinner("Reading course file..."):
+                    courses = parse_course_file(course_file)
+                
+                if courses:
+                    st.session_state.courses_data = courses
+                    st.success(f"✅ Successfully loaded {len(courses)} courses")
+                    
+                    # Show preview
+                    with st.expander("👀 Preview Courses", expanded=True):
+                        course_df = pd.DataFrame(courses, columns=["Course Name"])
+                        st.dataframe(course_df, use_container_width=True)
+                else:
+                    st.error("❌ No valid courses found in the file")
+    
+    # Show generation section if we have data
+    if st.session_state.students_data and st.session_state.courses_data:
+        show_generation_section()
+
+def show_manual_input_page():
+    """Display manual input page"""
+    st.header("📝 Manual Input")
+    
+    st.markdown("""
+    <div class="info-box">
+    <h4>🎯 FIXED NORMALIZATION:</h4>
+    <p><strong>Special characters including apostrophes are now removed:</strong></p>
+    <ul>
+        <li>Ng'ang'a → Nganga</li>
+        <li>O'nella → Onella</li>
+        <li>García → Garcia</li>
+        <li>D'cruz → Dcruz</li>
+    </ul>
+    </div>
+    """, unsafe_allow_html=True)
+    
+    col1, col2 = st.columns(2)
+    
+    with col1:
+        st.subheader("Enter Students")
+        st.markdown("**Format:** `Lastname, Firstname` (one per line)")
+        
+        student_text = st.text_area(
+            "Student list",
+            height=200,
+            placeholder="Mutie, Josiah\nKanziga, Belise\nNg'ang'a, John\nO'nella, Maria\nGarcía, José\nD'cruz, Anthony",
+            help="Enter students in 'Lastname, Firstname' format, one per line"
+        )
+        
+        if st.button("✅ Process Students", key="process_students", use_container_width=True):
+            if student_text:
+                students = parse_manual_students(student_text)
+                if students:
+                    st.session_state.students_data = students
+                    st.success(f"✅ Processed {len(students)} students")
+                    
+                    # Show preview
+                    with st.expander("👀 Preview Students", expanded=True):
+                        student_df = pd.DataFrame(students, columns=["Last Name", "First Name"])
+                        st.dataframe(student_df, use_container_width=True)
+                else:
+                    st.error("❌ No valid students found. Please check the format.")
+            else:
+                st.error("❌ Please enter some student data")
+    
+    with col2:
+        st.subheader("Enter Courses")
+        st.markdown("**Format:** Course names (one per line)")
+        
+        course_text = st.text_area(
+            "Course list",
+            height=200,
+            placeholder="Python Programming\nData Science\nMachine Learning\nStatistical Methods\nResearch Project",
+            help="Enter course names, one per line"
+        )
+        
+        if st.button("✅ Process Courses", key="process_courses", use_container_width=True):
+            if course_text:
+                courses = parse_manual_courses(course_text)
+                if courses:
+                    st.session_state.courses_data = courses
+                    st.success(f"✅ Processed {len(courses)} courses")
+                    
+                    # Show preview
+                    with st.expander("👀 Preview Courses", expanded=True):
+                        course_df = pd.DataFrame(courses, columns=["Course Name"])
+                        st.dataframe(course_df, use_container_width=True)
+                else:
+                    st.error("❌ No valid courses found")
+            else:
+                st.error("❌ Please enter some course data")
+    
+    # Show generation section if we have data
+    if st.session_state.students_data and st.session_state.courses_data:
+        show_generation_section()
+
+def show_generation_section():
+    """Show workspace generation section"""
+    st.markdown("---")
+    st.header("🚀 Generate Workspace")
+    
+    # Configuration
+    workspace_name = st.text_input(
+        "Workspace Folder Name",
+        value="AIMS-Rwanda-Workspace",
+        help="Name of the main directory to create"
+    )
+    
+    # Show data summary
+    col1, col2 = st.columns(2)
+    with col1:
+        st.info(f"📊 **Students:** {len(st.session_state.students_data)}")
+    with col2:
+        st.info(f"📊 **Courses:** {len(st.session_state.courses_data)}")
+    
+    # Generate button
+    if st.button("🎯 GENERATE DIRECTORY STRUCTURE", type="primary", use_container_width=True):
+        # Validate data
+        if not st.session_state.students_data:
+            st.error("❌ No students data available")
+            return
+        
+        if not st.session_state.courses_data:
+            st.error("❌ No courses data available")
+            return
+        
+        # Generate workspace
+        generate_workspace(workspace_name)
+
+def generate_workspace(workspace_name):
+    """Generate the workspace and show results"""
+    
+    # Progress tracking
+    progress_bar = st.progress(0)
+    status_text = st.empty()
+    
+    status_text.text("📋 Validating data...")
+    progress_bar.progress(20)
+    
+    status_text.text("🏗️ Creating directory structure...")
+    progress_bar.progress(60)
+    
+    try:
+        # Create directory structure (already-cleaned rows pass through the
+        # guard untouched, so reruns never re-normalize)
+        results = create_directory_structure(
+            ensure_cleaned(st.session_state.students_data),
+            st.session_state.courses_data,
+            workspace_name
+        )
+        
+        status_text.text("✅ Generation complete!")
+        progress_bar.progress(100)
+        
+        # Store results (and drop any stale cached path metadata for this
+        # workspace so the results view re-stats the fresh folder)
+        st.session_state.workspace_created = True
+        st.session_state.generation_results = results
+        st.session_state.pop(f"workspace_meta::{workspace_name}", None)
+
+        # Also drop any archive built before this generation - the workspace
+        # name may be unchanged, so the zip_src check alone would keep
+        # offering a ZIP that lacks the new folders
+        st.session_state.pop('zip_bytes', None)
+        st.session_state.pop('zip_src', None)
+        
+        st.success("🎉 Workspace generation completed successfully!")
+        
+        # Show results immediately
+        show_results_content(results)
+        
+    except Exception as e:
+        st.error(f"❌ Error during generation: {str(e)}")
+
+def show_results_page():
+    """Display results page"""
+    st.header("📊 Generation Results")
+    
+    if st.session_state.generation_results:
+        show_results_content(st.session_state.generation_results)
+    else:
+        st.info("ℹ️ No generation results available yet. Please generate a workspace first.")
+        
+        if st.session_state.students_data and st.session_state.courses_data:
+            if st.button("Generate Workspace Now", type="primary"):
+                generate_workspace("AIMS-Rwanda-Workspace")
+
+def show_results_content(results):
+    """Display the generation results content"""
+
+    # Resolve the workspace path once per base folder and keep it in session
+    # state - reruns reuse the cached stat/abspath instead of re-touching the
+    # filesystem on every widget interaction
+    meta_key = f"workspace_meta::{results['base_folder']}"
+    if meta_key not in st.session_state:
+        workspace = pathlib.Path(results['base_folder'])
+        st.session_state[meta_key] = (workspace.exists(),
+                                      str(workspace.resolve(strict=False)))
+    workspace_exists, workspace_abspath = st.session_state[meta_key]
+
+    st.markdown(f"""
+    <div class="success-box">
+    <h3>🎉 Workspace Generation Complete!</h3>
+    <p>Your directory structure has been successfully created in <strong>{results['base_folder']}</strong></p>
+    </div>
+    """, unsafe_allow_html=True)
+    
+    # Metrics
+    st.subheader("📈 Generation Metrics")
+    
+    col1, col2, col3, col4 = st.columns(4)
+    
+    with col1:
+        st.metric("Students Processed", results['students_processed'])
+    
+    with col2:
+        st.metric("Student Folders Created", results['students_created'])
+    
+    with col3:
+        st.metric("Course Folders Created", results['course_folders_created'])
+    
+    with col4:
+        st.metric("README Files Created", results['readmes_created'])
+    
+    # Folder structure preview
+    st.subheader("📁 Folder Structure Preview")
+    _tree_fragment(results, workspace_exists)
+    
+    # Download options
+    _downloads_fragment(results, workspace_exists, workspace_abspath)
+
+@_fragment
+def _tree_fragment(results, workspace_exists):
+    """Folder tree preview - collapsed by default and gated behind a toggle,
+    so the default page render never builds or ships the tree payload"""
+    if not workspace_exists:
+        st.error("❌ Generated folder not found. Please regenerate the workspace.")
+        return
+
+    entry_count = len(results.get('paths') or ())
+    label = (f"👀 View Folder Tree ({entry_count} files)"
+             if entry_count else "👀 View Folder Tree")
+    with st.expander(label, expanded=False):
+        # Expander children still execute while collapsed, so the walk only
+        # happens once the user flips the toggle
+        if st.checkbox("Show tree", value=False, key="show_tree"):
+            # st.code renders monospace without markdown parsing; language=None
+            # keeps the default python highlighter off the box-drawing art
+            st.code(generate_folder_tree(results['base_folder']), language=None)
+
+@_fragment
+def _downloads_fragment(results, workspace_exists, workspace_abspath):
+    """Download options - isolated in a fragment and backed by session state
+    so unrelated reruns neither re-zip nor drop the download link"""
+    st.subheader("📥 Download Options")
+
+    if not workspace_exists:
+        st.error("❌ Generated folder not found. Please regenerate the workspace.")
+        return
+
+    # Invalidate cached archive bytes when the target workspace changes
+    if st.session_state.get('zip_src') != results['base_folder']:
+        st.session_state['zip_src'] = results['base_folder']
+        st.session_state['zip_bytes'] = None
+
+    col1, col2 = st.columns(2)
+
+    with col1:
+        compress_zip = st.checkbox(
+            "🗜️ Compress ZIP (slower)",
+            value=False,
+            help="Use light DEFLATE compression instead of store-only"
+        )
+        if st.button("📦 Create ZIP Download", type="secondary", use_container_width=True):
+            with st.spinner("Creating ZIP archive..."):
+                sig = _workspace_signature(results['base_folder'])
+                # Only archive from the in-memory list when it matches what is
+                # actually on disk - stale folders left by a previous
+                # generation into the same workspace must not be silently
+                # dropped from the download, so otherwise fall back to a walk
+                files = tuple(results.get('files') or ())
+                if len(files) != sig[1]:
+                    files = None
+                st.session_state['zip_bytes'] = _cached_zip(
+                    results['base_folder'], sig, compress_zip, files
+                )
+
+        # Render the download link from the stored bytes so it survives
+        # reruns triggered by other widgets
+        zip_bytes = st.session_state.get('zip_bytes')
+        if zip_bytes:
+            st.download_button(
+                "⬇️ Download ZIP File",
+                data=zip_bytes,
+                file_name=f"{os.path.basename(results['base_folder'])}.zip",
+                mime="application/zip",
+                use_container_width=True
+            )
+            st.success("✅ ZIP file created successfully!")
+
+    with col2:
+        st.info(f"**Local Path:** `{workspace_abspath}`")
+
+# Static markdown for the instructions page - built once at import instead of
+# re-allocating the blocks on every rerun
+_MD_INSTRUCTIONS_HTML = """
+    <div class="info-box">
+    <h3>🎯 FIXED NORMALIZATION:</h3>
+    <p><strong>Now properly removes ALL special characters including apostrophes:</strong></p>
+    <ul>
+        <li><strong>Ng'ang'a</strong> → <strong>Nganga</strong> (apostrophes removed)</li>
+        <li><strong>O'nella</strong> → <strong>Onella</strong> (apostrophes removed)</li>
+        <li><strong>García-López</strong> → <strong>Garcia-Lopez</strong> (accents removed)</li>
+        <li><strong>François</strong> → <strong>Francois</strong> (accents removed)</li>
+        <li><strong>D'cruz</strong> → <strong>Dcruz</strong> (apostrophes removed)</li>
+    </ul>
+    </div>
+    """
+
+_MD_INPUT_FORMAT = """
+    **Student Data Format:**
+    - One student per line
+    - Format: `Lastname, Firstname`
+    - Example:
+    ```
+    Mutie, Josiah
+    Kanziga, Belise
+    Uwituze, Djadida
+    ```
+
+    **Course Data Format:**
+    - One course per line
+    - Just the course name
+    - Example:
+    ```
+    Python Programming
+    Data Science
+    Machine Learning
+    ```
+    """
+
+_MD_UPLOAD_OPTIONS = """
+    **Supported File Types:**
+    - CSV files (.csv)
+    - Text files (.txt)
+
+    **Encoding Support:**
+    - UTF-8 (recommended)
+    - Latin-1
+    - CP1252
+    - ISO-8859-1
+
+    **File Structure:**
+    - No complex headers needed
+    - Simple one-column format
+    - Automatic header detection
+    """
+
+_MD_TREE_EXAMPLE = """
+    ```
+    AIMS-Rwanda-Workspace/
+    ├── Mutie, Josiah/
+    │   ├── Python Programming/
+    │   │   └── README.txt
+    │   ├── Data Science/
+    │   │   └── README.txt
+    │   └── Machine Learning/
+    │       └── README.txt
+    ├── Kanziga, Belise/
+    │   ├── Python Programming/
+    │   │   └── README.txt
+    │   ├── Data Science/
+    │   │   └── README.txt
+    │   └── Machine Learning/
+    │       └── README.txt
+    └── ...
+    ```
+    """
+
+@_fragment
+def show_instructions_page():
+    """Display instructions page"""
+    st.header("📋 Instructions & Requirements")
+
+    st.markdown(_MD_INSTRUCTIONS_HTML, unsafe_allow_html=True)
+
+    col1, col2 = st.columns(2)
+
+    with col1:
+        st.subheader("📝 Input Format Requirements")
+        st.markdown(_MD_INPUT_FORMAT)
+
+    with col2:
+        st.subheader("🔄 File Upload Options")
+        st.markdown(_MD_UPLOAD_OPTIONS)
+
+    st.markdown("---")
+    st.subheader("🎯 Generated Structure")
+
+    st.markdown(_MD_TREE_EXAMPLE)
+
+if __name__ == "__main__":
+    try:
+        main()
+    except Exception as e:
+        st.error(f"Application error: {e!s}")
+        # Full traceback rendering is expensive - only pay for it when the
+        # debug flag is set; otherwise log it server-side
+        if st.session_state.get('debug'):
+            st.exception(e)
+        else:
+            logger.exception("Unhandled application error")
+        st.info("Please refresh the page and try again.")
 #streamlit run directories.py
\ No newline at end of file